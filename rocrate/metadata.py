@@ -81,10 +81,12 @@ def find_root_entity_id(entities):
     descriptor = entities.get(Metadata.BASENAME, entities.get(LegacyMetadata.BASENAME))
     if descriptor:
         return _check_descriptor(descriptor, entities)
+    # ids equal to the basenames have been handled above, so any other
+    # candidate must have them as its last path segment
+    suffixes = (f"/{Metadata.BASENAME}", f"/{LegacyMetadata.BASENAME}")
     candidates = []
     for id_, e in entities.items():
-        basename = id_.rsplit("/", 1)[-1]
-        if basename == Metadata.BASENAME or basename == LegacyMetadata.BASENAME:
+        if id_.endswith(suffixes):
             try:
                 candidates.append(_check_descriptor(e, entities))
             except ValueError:
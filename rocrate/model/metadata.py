@@ -61,11 +61,8 @@ class Metadata(File):
     # Generate the crate's `ro-crate-metadata.json`.
     # @return [String] The rendered JSON-LD as a "prettified" string.
     def generate(self):
-        graph = []
-        for entity in self.crate.get_entities():
-            graph.append(entity.properties())
-        context = [f'{self.PROFILE}/context']
-        context.extend(self.extra_contexts)
+        graph = [entity.properties() for entity in self.crate.get_entities()]
+        context = [f'{self.PROFILE}/context', *self.extra_contexts]
         if self.extra_terms:
             context.append(self.extra_terms)
         if len(context) == 1: